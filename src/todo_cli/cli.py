@@ -10,23 +10,31 @@ This module demonstrates modern CLI development practices:
 
 from __future__ import annotations
 
+import shlex
 import sys
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
 
 import click
+import orjson
 from rich.console import Console
-from rich.table import Table
-from rich.text import Text
 
-from todo_cli.models import TodoManager, TodoStorage
+from todo_cli.models import TodoItem, TodoManager, TodoStorage
+
+if TYPE_CHECKING:
+    from rich.table import Table
 
 # Global console instance for rich output
 console = Console()
 
 
-def create_todo_table(todos: list[Any]) -> Table:
+def create_todo_table(todos: Sequence[TodoItem]) -> Table:
     """Create a rich table for displaying todos."""
+    # Imported here so commands that never render a table skip the import
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("ID", style="dim", width=4)
     table.add_column("Status", width=8)
@@ -34,17 +42,18 @@ def create_todo_table(todos: list[Any]) -> Table:
     table.add_column("Description")
     table.add_column("Created", style="dim")
 
+    # Rendering does not modify Text objects, so every row can share them
+    done_text = Text("✓ Done", style="green")
+    pending_text = Text("○ Pending", style="yellow")
+
     for todo in todos:
-        status_text = (
-            Text("✓ Done", style="green")
-            if todo.completed
-            else Text("○ Pending", style="yellow")
-        )
-        created_date = todo.created_at.strftime("%Y-%m-%d %H:%M")
+        # Same text as strftime("%Y-%m-%d %H:%M") without parsing a format
+        # string per row; the slice drops any UTC offset on aware datetimes
+        created_date = todo.created_at.isoformat(" ", "minutes")[:16]
 
         table.add_row(
             str(todo.id),
-            status_text,
+            done_text if todo.completed else pending_text,
             todo.title,
             todo.description or "-",
             created_date,
@@ -53,8 +62,17 @@ def create_todo_table(todos: list[Any]) -> Table:
     return table
 
 
-def get_todo_manager(storage_file: str | None = None) -> TodoManager:
-    """Get a configured TodoManager instance."""
+def get_todo_manager(ctx: click.Context) -> TodoManager:
+    """Get the TodoManager for the current command.
+
+    Commands run from ``todo batch`` share the batch's manager; otherwise a
+    new manager is configured from the ``--storage-file`` option.
+    """
+    manager: TodoManager | None = ctx.obj.get("manager")
+    if manager is not None:
+        return manager
+
+    storage_file = ctx.obj["storage_file"]
     if storage_file:
         storage = TodoStorage(Path(storage_file))
         return TodoManager(storage)
@@ -66,7 +84,11 @@ def get_todo_manager(storage_file: str | None = None) -> TodoManager:
 @click.option(
     "--storage-file",
     type=click.Path(),
-    help="Path to the todo storage file (default: todos.json)",
+    help=(
+        "Path to the todo storage file; use .jsonl for JSON Lines or .pickle "
+        "for binary storage, which should only be loaded from trusted sources "
+        "(default: todos.json)"
+    ),
 )
 @click.pass_context
 def cli(ctx: click.Context, storage_file: str | None = None) -> None:
@@ -104,8 +126,8 @@ def add(ctx: click.Context, title: str, description: str) -> None:
       todo add "Finish project" "Complete the final report and review"
     """
     try:
-        manager = get_todo_manager(ctx.obj["storage_file"])
-        todo = manager.add_todo(title, description)
+        with get_todo_manager(ctx) as manager:
+            todo = manager.add_todo(title, description)
 
         console.print(f"✓ Added todo #{todo.id}: [bold]{title}[/bold]", style="green")
         if description:
@@ -125,7 +147,7 @@ def add(ctx: click.Context, title: str, description: str) -> None:
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["table", "simple"]),
+    type=click.Choice(["table", "simple", "json"]),
     default="table",
     help="Output format",
 )
@@ -139,9 +161,11 @@ def list_todos(
       todo list --completed true    (show only completed)
       todo list --completed false   (show only pending)
       todo list                     (show all)
+
+    Use --format json for machine-readable output.
     """
     try:
-        manager = get_todo_manager(ctx.obj["storage_file"])
+        manager = get_todo_manager(ctx)
 
         # Convert string to boolean for filtering
         completed_filter = None
@@ -152,6 +176,15 @@ def list_todos(
 
         todos = manager.get_todos(completed=completed_filter)
 
+        if output_format == "json":
+            # Same records, in the same key order, as the storage file;
+            # printed even when empty
+            payload = orjson.dumps(
+                [todo.to_dict() for todo in todos], option=orjson.OPT_INDENT_2
+            )
+            click.echo(payload.decode())
+            return
+
         if not todos:
             console.print("No todos found.", style="yellow")
             return
@@ -184,13 +217,13 @@ def complete(ctx: click.Context, todo_id: int) -> None:
       todo complete 1
     """
     try:
-        manager = get_todo_manager(ctx.obj["storage_file"])
+        with get_todo_manager(ctx) as manager:
+            completed = manager.complete_todo(todo_id)
 
-        if manager.complete_todo(todo_id):
+        if completed:
             console.print(f"✓ Completed todo #{todo_id}", style="green")
         else:
-            todo = manager.get_todo_by_id(todo_id)
-            if todo is None:
+            if manager.get_todo_by_id(todo_id) is None:
                 console.print(f"Todo #{todo_id} not found", style="red")
             else:
                 console.print(f"Todo #{todo_id} is already completed", style="yellow")
@@ -213,13 +246,13 @@ def uncomplete(ctx: click.Context, todo_id: int) -> None:
       todo uncomplete 1
     """
     try:
-        manager = get_todo_manager(ctx.obj["storage_file"])
+        with get_todo_manager(ctx) as manager:
+            uncompleted = manager.uncomplete_todo(todo_id)
 
-        if manager.uncomplete_todo(todo_id):
+        if uncompleted:
             console.print(f"○ Marked todo #{todo_id} as pending", style="yellow")
         else:
-            todo = manager.get_todo_by_id(todo_id)
-            if todo is None:
+            if manager.get_todo_by_id(todo_id) is None:
                 console.print(f"Todo #{todo_id} not found", style="red")
             else:
                 console.print(f"Todo #{todo_id} is already pending", style="yellow")
@@ -243,15 +276,16 @@ def delete(ctx: click.Context, todo_id: int) -> None:
       todo delete 1
     """
     try:
-        manager = get_todo_manager(ctx.obj["storage_file"])
+        with get_todo_manager(ctx) as manager:
+            # Get todo details before deletion for confirmation message
+            todo = manager.get_todo_by_id(todo_id)
+            if todo is None:
+                console.print(f"Todo #{todo_id} not found", style="red")
+                sys.exit(1)
 
-        # Get todo details before deletion for confirmation message
-        todo = manager.get_todo_by_id(todo_id)
-        if todo is None:
-            console.print(f"Todo #{todo_id} not found", style="red")
-            sys.exit(1)
+            deleted = manager.delete_todo(todo_id)
 
-        if manager.delete_todo(todo_id):
+        if deleted:
             console.print(
                 f"✗ Deleted todo #{todo_id}: [bold]{todo.title}[/bold]", style="red"
             )
@@ -278,9 +312,9 @@ def clear_completed(ctx: click.Context) -> None:
       todo clear-completed
     """
     try:
-        manager = get_todo_manager(ctx.obj["storage_file"])
+        with get_todo_manager(ctx) as manager:
+            count = manager.clear_completed()
 
-        count = manager.clear_completed()
         if count > 0:
             console.print(f"✗ Cleared {count} completed todo(s)", style="green")
         else:
@@ -304,20 +338,20 @@ def stats(ctx: click.Context) -> None:
       todo stats
     """
     try:
-        manager = get_todo_manager(ctx.obj["storage_file"])
+        manager = get_todo_manager(ctx)
 
-        all_todos = manager.get_todos()
-        completed_todos = manager.get_todos(completed=True)
-        pending_todos = manager.get_todos(completed=False)
+        total = manager.count_todos()
+        completed = manager.count_todos(completed=True)
+        pending = manager.count_todos(completed=False)
 
         console.print("\n[bold]Todo Statistics[/bold]")
         console.print("─" * 20)
-        console.print(f"Total todos: [bold]{len(all_todos)}[/bold]")
-        console.print(f"Completed: [green]{len(completed_todos)}[/green]")
-        console.print(f"Pending: [yellow]{len(pending_todos)}[/yellow]")
+        console.print(f"Total todos: [bold]{total}[/bold]")
+        console.print(f"Completed: [green]{completed}[/green]")
+        console.print(f"Pending: [yellow]{pending}[/yellow]")
 
-        if all_todos:
-            completion_rate = (len(completed_todos) / len(all_todos)) * 100
+        if total:
+            completion_rate = (completed / total) * 100
             console.print(f"Completion rate: [cyan]{completion_rate:.1f}%[/cyan]")
 
         console.print()
@@ -327,6 +361,88 @@ def stats(ctx: click.Context) -> None:
         sys.exit(1)
 
 
+@cli.command()
+@click.pass_context
+def batch(ctx: click.Context) -> None:
+    """Run several commands from standard input.
+
+    Each line holds one command with its arguments, written as on the
+    command line. All commands share one loaded todo list, and changes are
+    saved once at the end. Blank lines and lines starting with # are
+    skipped. Batch mode never prompts, so delete and clear-completed must
+    be given --yes.
+
+    Example:
+      printf 'add "Buy milk"\\ncomplete 1\\n' | todo batch
+    """
+    failures = 0
+    try:
+        with get_todo_manager(ctx) as manager:
+            ctx.obj["manager"] = manager
+            for line in sys.stdin:
+                try:
+                    args = shlex.split(line, comments=True)
+                except ValueError as e:
+                    console.print(
+                        f"Invalid batch line {line.strip()!r}: {e}", style="red"
+                    )
+                    failures += 1
+                    continue
+                if not args:
+                    continue
+                if not run_batch_command(ctx, args):
+                    failures += 1
+
+    except Exception as e:
+        console.print(f"Error running batch: {e}", style="red")
+        sys.exit(1)
+    finally:
+        ctx.obj.pop("manager", None)
+
+    if failures:
+        console.print(f"{failures} batch command(s) failed", style="red")
+        sys.exit(1)
+
+
+def run_batch_command(ctx: click.Context, args: list[str]) -> bool:
+    """Run a single batch command and return whether it succeeded."""
+    name, *command_args = args
+    command = cli.get_command(ctx, name)
+    if command is None or command is batch:
+        console.print(f"Unknown batch command: {name}", style="red")
+        return False
+
+    # A prompt would read its answer from the following batch lines, so
+    # commands that would ask for confirmation are refused instead
+    for param in command.params:
+        if (
+            isinstance(param, click.Option)
+            and param.prompt
+            and not any(opt in command_args for opt in param.opts)
+        ):
+            console.print(
+                f"{name} asks for confirmation; pass {param.opts[0]} in batch mode",
+                style="red",
+            )
+            return False
+
+    try:
+        with command.make_context(name, command_args, parent=ctx) as sub_ctx:
+            command.invoke(sub_ctx)
+    except click.ClickException as e:
+        e.show()
+        return False
+    except click.Abort:
+        console.print("Aborted.", style="yellow")
+        return False
+    except click.exceptions.Exit as e:
+        # Raised by --help; must not escape and discard the whole batch
+        return e.exit_code == 0
+    except SystemExit as e:
+        return not e.code
+    return True
+
+
 def main() -> None:
     """Entry point for the CLI application."""
     cli()
@@ -2,24 +2,35 @@
 
 from __future__ import annotations
 
-import json
+import io
+import os
+import pickle
+from bisect import bisect_left
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, ClassVar
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class TodoItem:
     """Represents a single todo item.
 
     This class demonstrates modern Python practices:
     - Dataclasses for clean data modeling
+    - Slots for compact instances and faster attribute access
     - Type hints for better code documentation
     - Immutable design with frozen=True option available
     - Proper __post_init__ usage for validation
     """
 
+    # Keyword-only so it can lead the field list, matching the stored key
+    # order, without becoming the first positional argument
+    id: int = field(default=0, kw_only=True)
     title: str
     description: str = ""
     completed: bool = False
@@ -27,9 +38,8 @@ class TodoItem:
         default_factory=datetime.now,
     )
     completed_at: datetime | None = None
-    id: int = field(default=0, init=False)
 
-    # Class variable for auto-incrementing IDs
+    # Class variable for auto-incrementing IDs, advanced by TodoManager.load
     _next_id: ClassVar[int] = 1
 
     def __post_init__(self) -> None:
@@ -37,7 +47,7 @@ class TodoItem:
         if not self.title.strip():
             raise ValueError("Todo title cannot be empty")
 
-        # Auto-assign ID if not set
+        # Auto-assign ID if not given explicitly
         if self.id == 0:
             self.id = TodoItem._next_id
             TodoItem._next_id += 1
@@ -69,28 +79,54 @@ class TodoItem:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> TodoItem:
-        """Create todo item from dictionary (JSON deserialization)."""
-        # Update the next_id counter to avoid conflicts
-        if data["id"] >= cls._next_id:
-            cls._next_id = data["id"] + 1
-
-        item = cls(
+        """Create todo item from dictionary (JSON deserialization).
+
+        The stored ID is kept as is; TodoManager.load advances the ID counter
+        once for the whole list instead of per item. IDs below 1 are rejected
+        rather than silently renumbered, since 0 means "assign one".
+        """
+        todo_id = data["id"]
+        if todo_id < 1:
+            raise ValueError(f"Invalid todo ID: {todo_id}")
+        completed_at = data.get("completed_at")
+        return cls(
             title=data["title"],
             description=data.get("description", ""),
             completed=data.get("completed", False),
             created_at=datetime.fromisoformat(data["created_at"]),
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+            id=todo_id,
         )
-        item.id = data["id"]
 
-        if data.get("completed_at"):
-            item.completed_at = datetime.fromisoformat(data["completed_at"])
 
-        return item
+class _TodoUnpickler(pickle.Unpickler):
+    """Unpickler that can only rebuild todos and their timestamps.
+
+    A plain pickle.loads imports and calls whatever the file names, so a
+    crafted .pickle file could run arbitrary code.
+    """
+
+    _allowed: ClassVar[frozenset[tuple[str, str]]] = frozenset(
+        {("todo_cli.models", "TodoItem"), ("datetime", "datetime")}
+    )
+
+    def find_class(self, module: str, name: str, /) -> Any:
+        """Resolve a global, refusing anything a todo list does not use."""
+        if (module, name) not in self._allowed:
+            raise pickle.UnpicklingError(f"Refusing to load {module}.{name}")
+        return super().find_class(module, name)
 
 
 class TodoStorage:
     """Handles persistence of todo items to JSON file.
 
+    Files ending in ``.jsonl`` are stored as JSON Lines (one todo per line),
+    which lets new todos be appended without rewriting the whole file.
+    Files ending in ``.pickle`` or ``.pkl`` use a compact binary format that
+    is faster to load and save but cannot be edited by hand; only todos and
+    datetimes are unpickled from them, but they should still only be loaded
+    from trusted sources.
+
     This class demonstrates:
     - Separation of concerns (storage vs business logic)
     - Proper error handling
@@ -101,6 +137,31 @@ class TodoStorage:
     def __init__(self, file_path: Path | str = "todos.json") -> None:
         """Initialize storage with file path."""
         self.file_path = Path(file_path)
+        self.line_delimited = self.file_path.suffix == ".jsonl"
+        self.binary = self.file_path.suffix in {".pickle", ".pkl"}
+
+    @staticmethod
+    def _encode_lines(todos: list[TodoItem]) -> bytes:
+        """Encode todos as JSON Lines, one object per line."""
+        return b"".join(
+            orjson.dumps(todo.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+            for todo in todos
+        )
+
+    @staticmethod
+    def _decode_binary(raw: bytes) -> list[TodoItem]:
+        """Decode a pickled list of todos, checking its contents."""
+        try:
+            todos = _TodoUnpickler(io.BytesIO(raw)).load()
+        except Exception as e:
+            # Corrupt or stale files (e.g. after a class or field rename) can
+            # raise almost anything while unpickling
+            raise ValueError(f"Could not unpickle todos: {e!r}") from e
+        if not isinstance(todos, list) or not all(
+            isinstance(todo, TodoItem) for todo in todos
+        ):
+            raise ValueError("File does not contain a list of todos")
+        return todos
 
     def load_todos(self) -> list[TodoItem]:
         """Load all todos from storage file."""
@@ -108,30 +169,70 @@ class TodoStorage:
             return []
 
         try:
-            with self.file_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                return [TodoItem.from_dict(item_data) for item_data in data]
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            raw = self.file_path.read_bytes()
+            if self.binary:
+                return self._decode_binary(raw)
+            if self.line_delimited:
+                data = [orjson.loads(line) for line in raw.splitlines() if line.strip()]
+            else:
+                data = orjson.loads(raw)
+            return [TodoItem.from_dict(item_data) for item_data in data]
+        except (orjson.JSONDecodeError, KeyError, ValueError) as e:
             raise RuntimeError(
                 f"Failed to load todos from {self.file_path}: {e}"
             ) from e
 
     def save_todos(self, todos: list[TodoItem]) -> None:
         """Save all todos to storage file."""
+        temp_path = self.file_path.with_name(f"{self.file_path.name}.tmp")
         try:
             # Ensure parent directory exists
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with self.file_path.open("w", encoding="utf-8") as f:
-                json.dump(
-                    [todo.to_dict() for todo in todos],
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
+            # orjson encodes straight to UTF-8 bytes, so the whole payload
+            # is written with a single call instead of token by token. The
+            # records come from to_dict(), which stays the one definition of
+            # the stored form and its key order.
+            if self.binary:
+                payload = pickle.dumps(todos, protocol=pickle.HIGHEST_PROTOCOL)
+            elif self.line_delimited:
+                payload = self._encode_lines(todos)
+            else:
+                payload = orjson.dumps(
+                    [todo.to_dict() for todo in todos], option=orjson.OPT_INDENT_2
                 )
-        except (OSError, json.JSONDecodeError) as e:
+
+            # Write to a sibling temp file and swap it in, so an interrupted
+            # save never leaves a truncated storage file behind
+            temp_path.write_bytes(payload)
+            temp_path.replace(self.file_path)
+        except (OSError, orjson.JSONEncodeError) as e:
+            temp_path.unlink(missing_ok=True)
             raise RuntimeError(f"Failed to save todos to {self.file_path}: {e}") from e
 
+    def append_todos(self, todos: list[TodoItem]) -> None:
+        """Append todos to a JSON Lines storage file without rewriting it."""
+        if not self.line_delimited:
+            raise ValueError("Appending requires a .jsonl storage file")
+
+        try:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            payload = self._encode_lines(todos)
+            with self.file_path.open("a+b") as f:
+                # Start on a new line if the file was edited by hand and
+                # lost its trailing newline
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        payload = b"\n" + payload
+                f.write(payload)
+        except (OSError, orjson.JSONEncodeError) as e:
+            raise RuntimeError(
+                f"Failed to append todos to {self.file_path}: {e}"
+            ) from e
+
 
 class TodoManager:
     """Manages todo items and coordinates with storage.
@@ -144,42 +245,113 @@ class TodoManager:
     """
 
     def __init__(self, storage: TodoStorage | None = None) -> None:
-        """Initialize manager with optional storage backend."""
+        """Initialize manager with optional storage backend.
+
+        Todos are loaded lazily, on the first call that needs them.
+        """
         self.storage = storage or TodoStorage()
         self._todos: list[TodoItem] = []
-        self.load()
+        self._by_id: dict[int, TodoItem] = {}
+        self._added: list[TodoItem] = []
+        self._dirty = False
+        self._loaded = False
+        self._depth = 0
+
+    def __enter__(self) -> TodoManager:
+        """Return the manager for use in a ``with`` block."""
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        """Flush pending changes unless the block raised an error.
+
+        Nested ``with`` blocks only flush when the outermost one exits.
+        """
+        self._depth -= 1
+        if exc_type is None and self._depth == 0:
+            self.flush()
 
     def load(self) -> None:
-        """Load todos from storage."""
+        """Load todos from storage, discarding unsaved changes."""
         self._todos = self.storage.load_todos()
+        self._by_id = {todo.id: todo for todo in self._todos}
+        # Never move the counter back: other managers in the same process may
+        # already hold todos with higher IDs
+        TodoItem._next_id = max(TodoItem._next_id, max(self._by_id, default=0) + 1)
+        self._added = []
+        self._dirty = False
+        self._loaded = True
+
+    def _ensure_loaded(self) -> None:
+        """Load todos from storage unless they are already loaded."""
+        if not self._loaded:
+            self.load()
 
     def save(self) -> None:
         """Save todos to storage."""
+        self._ensure_loaded()
         self.storage.save_todos(self._todos)
+        self._added = []
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Save todos to storage if they changed since the last save.
+
+        Mutating methods only mark the manager as dirty, so a batch of
+        changes is written with a single save. When only new todos were
+        added and the storage is line-delimited, they are appended instead
+        of rewriting the file.
+        """
+        if self._dirty or (self._added and not self.storage.line_delimited):
+            self.save()
+        elif self._added:
+            self.storage.append_todos(self._added)
+            self._added = []
 
     def add_todo(self, title: str, description: str = "") -> TodoItem:
         """Add a new todo item."""
+        self._ensure_loaded()
         todo = TodoItem(title=title, description=description)
         self._todos.append(todo)
-        self.save()
+        self._by_id[todo.id] = todo
+        self._added.append(todo)
         return todo
 
-    def get_todos(self, completed: bool | None = None) -> list[TodoItem]:
-        """Get todos, optionally filtered by completion status."""
+    def get_todos(self, completed: bool | None = None) -> Sequence[TodoItem]:
+        """Get todos, optionally filtered by completion status.
+
+        Without a filter the manager's own list is returned rather than a
+        copy, so callers must treat the result as read-only.
+        """
+        self._ensure_loaded()
         if completed is None:
-            return self._todos.copy()
+            return self._todos
         return [todo for todo in self._todos if todo.completed == completed]
 
     def get_todo_by_id(self, todo_id: int) -> TodoItem | None:
         """Get a specific todo by ID."""
-        return next((todo for todo in self._todos if todo.id == todo_id), None)
+        self._ensure_loaded()
+        return self._by_id.get(todo_id)
+
+    def count_todos(self, completed: bool | None = None) -> int:
+        """Count todos, optionally filtered by completion status.
+
+        Unlike len(get_todos(...)) this never builds a list. The completed
+        count is taken from the todos themselves on each call, so it stays
+        right even when a todo returned by get_todos() is completed directly.
+        """
+        self._ensure_loaded()
+        if completed is None:
+            return len(self._todos)
+        done = sum(1 for todo in self._todos if todo.completed)
+        return done if completed else len(self._todos) - done
 
     def complete_todo(self, todo_id: int) -> bool:
         """Mark a todo as completed."""
         todo = self.get_todo_by_id(todo_id)
         if todo and not todo.completed:
             todo.complete()
-            self.save()
+            self._dirty = True
             return True
         return False
 
@@ -188,7 +360,7 @@ class TodoManager:
         todo = self.get_todo_by_id(todo_id)
         if todo and todo.completed:
             todo.uncomplete()
-            self.save()
+            self._dirty = True
             return True
         return False
 
@@ -196,15 +368,32 @@ class TodoManager:
         """Delete a todo by ID."""
         todo = self.get_todo_by_id(todo_id)
         if todo:
-            self._todos.remove(todo)
-            self.save()
+            # IDs are handed out in increasing order, so the list is normally
+            # sorted by ID and the position can be found with a binary search.
+            # Fall back to a scan for hand-edited files that are not sorted.
+            index = bisect_left(self._todos, todo_id, key=attrgetter("id"))
+            if index < len(self._todos) and self._todos[index] is todo:
+                del self._todos[index]
+            else:
+                self._todos.remove(todo)
+            del self._by_id[todo_id]
+            self._dirty = True
             return True
         return False
 
     def clear_completed(self) -> int:
         """Remove all completed todos and return count of removed items."""
-        completed_todos = [todo for todo in self._todos if todo.completed]
-        self._todos = [todo for todo in self._todos if not todo.completed]
-        if completed_todos:
-            self.save()
-        return len(completed_todos)
+        self._ensure_loaded()
+        kept: list[TodoItem] = []
+        removed = 0
+        for todo in self._todos:
+            if todo.completed:
+                removed += 1
+                self._by_id.pop(todo.id, None)
+            else:
+                kept.append(todo)
+
+        if removed:
+            self._todos = kept
+            self._dirty = True
+        return removed
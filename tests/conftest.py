@@ -6,31 +6,70 @@ demonstrating modern pytest practices.
 
 from __future__ import annotations
 
-import tempfile
-from collections.abc import Generator
+import shutil
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
+import orjson
 import pytest
-from click.testing import CliRunner
-
-from todo_cli.models import TodoManager, TodoStorage
+from click.testing import CliRunner, Result
+
+from todo_cli.cli import cli
+from todo_cli.models import TodoItem, TodoManager, TodoStorage
+
+# One completed and one pending todo, in the format written by TodoStorage
+MIXED_TODOS: list[dict[str, Any]] = [
+    {
+        "id": 1,
+        "title": "Completed todo",
+        "description": "",
+        "completed": True,
+        "created_at": "2024-01-01T12:00:00",
+        "completed_at": "2024-01-01T13:00:00",
+    },
+    {
+        "id": 2,
+        "title": "Pending todo",
+        "description": "",
+        "completed": False,
+        "created_at": "2024-01-01T12:30:00",
+        "completed_at": None,
+    },
+]
+MIXED_TODOS_JSON = orjson.dumps(MIXED_TODOS)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports() -> None:
+    """Import the rich modules the CLI loads lazily, once per session.
+
+    This keeps the import cost out of whichever test renders a table first.
+    """
+    import rich.table
+    import rich.text  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def _reset_todo_ids(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test from ID 1.
+
+    The ID counter is process-wide and loading never moves it back, so
+    without this the IDs a test sees would depend on the tests before it.
+    """
+    monkeypatch.setattr(TodoItem, "_next_id", 1)
 
 
 @pytest.fixture
-def temp_storage_file() -> Generator[Path]:  # type: ignore[type-arg]
-    """Create a temporary storage file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-        temp_path = Path(f.name)
-
-    # Check if the file is empty, write "[]" if so
-    if temp_path.stat().st_size == 0:
-        temp_path.write_text("[]")
+def temp_storage_file(tmp_path: Path) -> Path:
+    """Create a temporary storage file for testing.
 
-    yield temp_path
-
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+    The file lives in pytest's per-test tmp_path, so parallel pytest-xdist
+    workers never share storage.
+    """
+    temp_path = tmp_path / "todos.json"
+    temp_path.write_bytes(b"[]")
+    return temp_path
 
 
 @pytest.fixture
@@ -46,28 +85,123 @@ def todo_manager(todo_storage: TodoStorage) -> TodoManager:
 
 
 @pytest.fixture
-def sample_todos(todo_manager: TodoManager) -> TodoManager:
-    """Create a TodoManager with some sample todos for testing."""
-    todo_manager.add_todo("Learn Python", "Study modern Python practices")
-    todo_manager.add_todo("Write tests", "Create comprehensive test suite")
-    todo_manager.add_todo("Deploy app", "Set up CI/CD pipeline")
-
+def pending_todo(todo_manager: TodoManager) -> TodoItem:
+    """Add a pending todo to todo_manager and return it."""
+    return todo_manager.add_todo("Test todo")
+
+
+@pytest.fixture(scope="session")
+def sample_storage(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a storage file holding the sample todos, shared by the session.
+
+    Tests must not modify this file; use the sample_todos fixture instead.
+    """
+    todos = [
+        TodoItem("Learn Python", "Study modern Python practices", id=1),
+        TodoItem("Write tests", "Create comprehensive test suite", id=2),
+        TodoItem("Deploy app", "Set up CI/CD pipeline", id=3),
+    ]
     # Mark one as completed
-    todos = todo_manager.get_todos()
-    if todos:
-        todo_manager.complete_todo(todos[0].id)
+    todos[0].complete()
 
-    return todo_manager
+    storage_file = tmp_path_factory.mktemp("sample") / "todos.json"
+    TodoStorage(storage_file).save_todos(todos)
+    return storage_file
 
 
 @pytest.fixture
+def sample_todos(sample_storage: Path, temp_storage_file: Path) -> TodoManager:
+    """Create a TodoManager with some sample todos for testing.
+
+    The todos are loaded from a private copy of sample_storage.
+    """
+    shutil.copyfile(sample_storage, temp_storage_file)
+    return TodoManager(TodoStorage(temp_storage_file))
+
+
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
-    """Create a Click CLI test runner."""
+    """Create a Click CLI test runner, shared by the whole session.
+
+    Every invoke sets up its own isolated streams, so one runner is safe to
+    reuse across tests.
+    """
     return CliRunner()
 
 
+InvokeCli = Callable[..., Result]
+
+
+def _storage_invoker(runner: CliRunner, storage_file: Path) -> InvokeCli:
+    """Return a helper that invokes the CLI against the given storage file."""
+    prefix = ["--storage-file", str(storage_file)]
+
+    def invoke(*args: str, **kwargs: Any) -> Result:
+        return runner.invoke(cli, [*prefix, *args], **kwargs)
+
+    return invoke
+
+
+@pytest.fixture
+def isolated_cli_runner(
+    cli_runner: CliRunner, temp_storage_file: Path
+) -> tuple[InvokeCli, Path]:
+    """Create a CLI invoker bound to isolated temporary storage.
+
+    The invoker takes the subcommand and its arguments; the --storage-file
+    option is prepended automatically.
+    """
+    return _storage_invoker(cli_runner, temp_storage_file), temp_storage_file
+
+
+SeedTodos = Callable[[Path, list[dict[str, Any]]], None]
+
+
+@pytest.fixture(scope="session")
+def seed_todos() -> SeedTodos:
+    """Return a helper that writes todos straight to a storage file.
+
+    Seeding the file directly is much cheaper than building state through
+    CLI invocations. Each todo needs a title; the other fields default to a
+    pending todo, with IDs numbered from 1 in list order. Completed todos get
+    a completed_at timestamp unless one is given, as TodoItem.complete() would.
+    """
+
+    def seed(storage_file: Path, todos: list[dict[str, Any]]) -> None:
+        records = []
+        for index, todo in enumerate(todos, start=1):
+            completed = todo.get("completed", False)
+            records.append(
+                {
+                    "id": index,
+                    "description": "",
+                    "completed": completed,
+                    "created_at": "2024-01-01T12:00:00",
+                    "completed_at": "2024-01-01T13:00:00" if completed else None,
+                    **todo,
+                }
+            )
+        storage_file.write_bytes(orjson.dumps(records))
+
+    return seed
+
+
+@pytest.fixture(scope="class")
+def prepopulated_storage(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a storage file holding MIXED_TODOS, shared across a test class.
+
+    Tests must not modify this file; use prepopulated_cli_runner instead.
+    """
+    storage_file = tmp_path_factory.mktemp("prepopulated") / "todos.json"
+    storage_file.write_bytes(MIXED_TODOS_JSON)
+    return storage_file
+
+
 @pytest.fixture
-def isolated_cli_runner(temp_storage_file: Path) -> tuple[CliRunner, Path]:
-    """Create a CLI runner with isolated temporary storage."""
-    runner = CliRunner()
-    return runner, temp_storage_file
+def prepopulated_cli_runner(
+    cli_runner: CliRunner, prepopulated_storage: Path, tmp_path: Path
+) -> tuple[InvokeCli, Path]:
+    """Create a CLI invoker bound to a private copy of the prepopulated storage."""
+    storage_file = tmp_path / "todos.json"
+    shutil.copyfile(prepopulated_storage, storage_file)
+    return _storage_invoker(cli_runner, storage_file), storage_file
@@ -7,12 +7,19 @@ and comprehensive integration testing practices.
 from __future__ import annotations
 
 import json
-import re
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-from click.testing import CliRunner
+import pytest
 
 from todo_cli.cli import cli
+from todo_cli.models import TodoItem
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from click.testing import CliRunner
+
+    from tests.conftest import InvokeCli, SeedTodos
 
 
 class TestCLIBasic:
@@ -23,10 +30,11 @@ class TestCLIBasic:
         result = cli_runner.invoke(cli, ["--help"])
 
         assert result.exit_code == 0
-        assert "Modern Todo CLI" in result.output
-        assert "add" in result.output
-        assert "list" in result.output
-        assert "complete" in result.output
+        out = result.output
+        assert "Modern Todo CLI" in out
+        assert "add" in out
+        assert "list" in out
+        assert "complete" in out
 
     def test_cli_version(self, cli_runner: CliRunner) -> None:
         """Test CLI version display."""
@@ -39,268 +47,193 @@ class TestCLIBasic:
 class TestAddCommand:
     """Test the add command."""
 
-    def test_add_todo_with_title_only(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
-    ) -> None:
-        """Test adding todo with title only."""
-        runner, storage_file = isolated_cli_runner
-
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "add", "Learn Python"]
-        )
-
-        assert result.exit_code == 0
-        assert "Added todo #1: Learn Python" in result.output
-
-    def test_add_todo_with_description(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
-    ) -> None:
-        """Test adding todo with title and description."""
-        runner, storage_file = isolated_cli_runner
-
-        result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "add",
-                "Learn Python",
-                "Study modern practices",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert re.search(r"Added todo #\d+: Learn Python", result.output)
-        assert "Description: Study modern practices" in result.output
-
-    def test_add_empty_title_error(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+    @pytest.mark.parametrize(
+        ("add_args", "exit_code", "needles"),
+        [
+            pytest.param(
+                ["Learn Python"],
+                0,
+                ["Added todo #1: Learn Python"],
+                id="title-only",
+            ),
+            pytest.param(
+                ["Learn Python", "Study modern practices"],
+                0,
+                [
+                    "Added todo #1: Learn Python",
+                    "Description: Study modern practices",
+                ],
+                id="with-description",
+            ),
+            pytest.param([""], 1, ["Error adding todo"], id="empty-title"),
+        ],
+    )
+    def test_add_todo(
+        self,
+        isolated_cli_runner: tuple[InvokeCli, Path],
+        add_args: list[str],
+        exit_code: int,
+        needles: list[str],
     ) -> None:
-        """Test adding todo with empty title shows error."""
-        runner, storage_file = isolated_cli_runner
+        """Test adding todos, including the empty-title error."""
+        invoke, _ = isolated_cli_runner
 
-        result = runner.invoke(cli, ["--storage-file", str(storage_file), "add", ""])
+        result = invoke("add", *add_args)
 
-        assert result.exit_code == 1
-        assert "Error adding todo" in result.output
+        assert result.exit_code == exit_code
+        out = result.output
+        for needle in needles:
+            assert needle in out
 
     def test_add_multiple_todos(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path]
     ) -> None:
         """Test adding multiple todos increments IDs."""
 
-        runner, storage_file = isolated_cli_runner
+        invoke, _ = isolated_cli_runner
 
         # Add first todo
-        result1 = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "add",
-                "First todo",
-            ],
-        )
+        result1 = invoke("add", "First todo")
         assert result1.exit_code == 0
-        assert re.search(r"Added todo #\d+: First todo", result1.output)
+        assert "Added todo #1: First todo" in result1.output
 
         # Add second todo
-        result2 = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "add", "Second todo"]
-        )
+        result2 = invoke("add", "Second todo")
         assert result2.exit_code == 0
-        assert "Added todo #" in result2.output
-        assert "Second todo" in result2.output
+        assert "Added todo #2: Second todo" in result2.output
 
 
 class TestListCommand:
     """Test the list command."""
 
-    def test_list_empty(self, isolated_cli_runner: tuple[CliRunner, Path]) -> None:
+    def test_list_empty(self, isolated_cli_runner: tuple[InvokeCli, Path]) -> None:
         """Test listing when no todos exist."""
-        runner, storage_file = isolated_cli_runner
+        invoke, _ = isolated_cli_runner
 
-        result = runner.invoke(cli, ["--storage-file", str(storage_file), "list"])
+        result = invoke("list")
 
         assert result.exit_code == 0
         assert "No todos found" in result.output
 
     def test_list_todos_table_format(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
     ) -> None:
         """Test listing todos in table format (default)."""
-        runner, storage_file = isolated_cli_runner
-
-        # Add some todos first
-        runner.invoke(
-            cli,
-            ["--storage-file", str(storage_file), "add", "First todo", "Description 1"],
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(
+            storage_file,
+            [
+                {"title": "First todo", "description": "Description 1"},
+                {"title": "Second todo"},
+            ],
         )
-        runner.invoke(cli, ["--storage-file", str(storage_file), "add", "Second todo"])
 
-        result = runner.invoke(cli, ["--storage-file", str(storage_file), "list"])
+        result = invoke("list")
 
         assert result.exit_code == 0
-        assert "First todo" in result.output
-        assert "Second todo" in result.output
-        assert "Description 1" in result.output
+        out = result.output
+        assert "First todo" in out
+        assert "Second todo" in out
+        assert "Description 1" in out
         # Table format should include headers
-        assert "ID" in result.output
-        assert "Status" in result.output
+        assert "ID" in out
+        assert "Status" in out
 
     def test_list_todos_simple_format(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
     ) -> None:
         """Test listing todos in simple format."""
-        runner, storage_file = isolated_cli_runner
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(storage_file, [{"title": "Test todo"}])
 
-        # Add a todo first
-        runner.invoke(cli, ["--storage-file", str(storage_file), "add", "Test todo"])
-
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "list", "--format", "simple"]
-        )
+        result = invoke("list", "--format", "simple")
 
         assert result.exit_code == 0
-        assert re.search(r"○ \[\d+\] Test todo", result.output)
+        assert "○ [1] Test todo" in result.output
 
-    def test_list_completed_only(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+    def test_list_json_format_empty(
+        self, isolated_cli_runner: tuple[InvokeCli, Path]
     ) -> None:
-        """Test listing only completed todos."""
-        runner, storage_file = isolated_cli_runner
-
-        # Add and complete a todo
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "add", "Completed todo"]
-        )
-
-        todo_id = re.findall(r"Added todo #(\d+): Completed todo", result.output)
-        assert todo_id is not None
-        runner.invoke(
-            cli,
-            ["--storage-file", str(storage_file), "complete", todo_id[0]],
-        )
-        runner.invoke(cli, ["--storage-file", str(storage_file), "add", "Pending todo"])
+        """Test that JSON output is an empty list when no todos exist."""
+        invoke, _ = isolated_cli_runner
 
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "list", "--completed", "true"]
-        )
+        result = invoke("list", "--format", "json")
 
         assert result.exit_code == 0
-        assert "Completed todo" in result.output
-        assert "Pending todo" not in result.output
+        assert json.loads(result.output) == []
 
-    def test_list_pending_only(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+    def test_list_json_matches_stored_records(
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
     ) -> None:
-        """Test listing only pending todos."""
-        runner, storage_file = isolated_cli_runner
+        """Test that JSON output uses the stored form and its key order."""
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(storage_file, [{"title": "Test todo", "completed": True}])
 
-        # Add and complete a todo
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "add", "Completed todo"]
-        )
-        todo_id = re.findall(r"Added todo #(\d+): Completed todo", result.output)
-        assert todo_id is not None
-        runner.invoke(
+        result = invoke("list", "--format", "json")
+
+        assert result.exit_code == 0
+        (record,) = json.loads(result.output)
+        expected = TodoItem.from_dict(record).to_dict()
+        assert record == expected
+        assert list(record) == list(expected)
+
+    @pytest.mark.parametrize(
+        ("completed", "titles"),
+        [("true", ["Completed todo"]), ("false", ["Pending todo"])],
+    )
+    def test_list_filtered_by_status(
+        self,
+        cli_runner: CliRunner,
+        prepopulated_storage: Path,
+        completed: str,
+        titles: list[str],
+    ) -> None:
+        """Test listing only completed or only pending todos."""
+        result = cli_runner.invoke(
             cli,
             [
                 "--storage-file",
-                str(storage_file),
-                "complete",
-                todo_id[0],
+                str(prepopulated_storage),
+                "list",
+                "--completed",
+                completed,
+                "--format",
+                "json",
             ],
         )
-        runner.invoke(cli, ["--storage-file", str(storage_file), "add", "Pending todo"])
-
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "list", "--completed", "false"]
-        )
 
         assert result.exit_code == 0
-        assert "Pending todo" in result.output
-        assert "Completed todo" not in result.output
+        data = json.loads(result.output)
+        assert [todo["title"] for todo in data] == titles
+        assert all(todo["completed"] is (completed == "true") for todo in data)
 
 
 class TestCompleteCommand:
     """Test the complete command."""
 
-    def test_complete_todo(self, isolated_cli_runner: tuple[CliRunner, Path]) -> None:
+    def test_complete_todo(
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
+    ) -> None:
         """Test completing a todo."""
-        runner, storage_file = isolated_cli_runner
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(storage_file, [{"title": "Test todo"}])
 
-        # Add a todo first
-        result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "add",
-                "Test todo",
-            ],
-        )
-        todo_id = re.findall(r"Added todo #(\d+): Test todo", result.output)
-        assert todo_id is not None
-
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "complete", todo_id[0]]
-        )
+        result = invoke("complete", "1")
 
         assert result.exit_code == 0
-        assert f"Completed todo #{todo_id[0]}" in result.output
-
-        # Verify it's marked as completed in list
-        list_result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "list",
-                "--format",
-                "simple",
-            ],
-        )
-        assert f"✓ [{todo_id[0]}] Test todo" in list_result.output
-
-    def test_complete_nonexistent_todo(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
-    ) -> None:
-        """Test completing nonexistent todo."""
-        runner, storage_file = isolated_cli_runner
-
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "complete", "999"]
-        )
+        assert "Completed todo #1" in result.output
 
-        assert result.exit_code == 1
-        assert "Todo #999 not found" in result.output
+        # Verify it's marked as completed in storage
+        data = json.loads(storage_file.read_text())
+        assert data[0]["id"] == 1
+        assert data[0]["completed"] is True
 
     def test_complete_already_completed_todo(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, cli_runner: CliRunner, prepopulated_storage: Path
     ) -> None:
         """Test completing already completed todo."""
-        runner, storage_file = isolated_cli_runner
-
-        # Add and complete a todo
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "add", "Test todo"]
-        )
-        todo_id = re.findall(r"Added todo #(\d+): Test todo", result.output)
-        assert todo_id is not None
-        runner.invoke(
-            cli, ["--storage-file", str(storage_file), "complete", todo_id[0]]
-        )
-
-        # Try to complete again
-        result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "complete",
-                todo_id[0],
-            ],
+        result = cli_runner.invoke(
+            cli, ["--storage-file", str(prepopulated_storage), "complete", "1"]
         )
 
         assert result.exit_code == 1
@@ -310,215 +243,90 @@ class TestCompleteCommand:
 class TestUncompleteCommand:
     """Test the uncomplete command."""
 
-    def test_uncomplete_todo(self, isolated_cli_runner: tuple[CliRunner, Path]) -> None:
+    def test_uncomplete_todo(
+        self, prepopulated_cli_runner: tuple[InvokeCli, Path]
+    ) -> None:
         """Test uncompleting a todo."""
-        runner, storage_file = isolated_cli_runner
+        invoke, storage_file = prepopulated_cli_runner
 
-        # Add and complete a todo
-        result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "add",
-                "Test todo",
-            ],
-        )
-        todo_id = re.findall(r"Added todo #(\d+): Test todo", result.output)
-        assert todo_id is not None
-        runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "complete",
-                todo_id[0],
-            ],
-        )
-
-        result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "uncomplete",
-                todo_id[0],
-            ],
-        )
+        result = invoke("uncomplete", "1")
 
         assert result.exit_code == 0
-        assert f"Marked todo #{todo_id[0]} as pending" in result.output
+        assert "Marked todo #1 as pending" in result.output
 
-        # Verify it's marked as pending in list
-        list_result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "list", "--format", "simple"]
-        )
-        assert f"○ [{todo_id[0]}] Test todo" in list_result.output
-
-    def test_uncomplete_nonexistent_todo(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
-    ) -> None:
-        """Test uncompleting nonexistent todo."""
-        runner, storage_file = isolated_cli_runner
-
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "uncomplete", "999"]
-        )
-
-        assert result.exit_code == 1
-        assert "Todo #999 not found" in result.output
+        # Verify it's marked as pending in storage
+        data = json.loads(storage_file.read_text())
+        assert data[0]["completed"] is False
+        assert data[0]["completed_at"] is None
 
 
 class TestDeleteCommand:
     """Test the delete command."""
 
     def test_delete_todo_with_confirmation(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
     ) -> None:
         """Test deleting a todo with confirmation."""
-        runner, storage_file = isolated_cli_runner
-
-        # Add a todo first
-        result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "add",
-                "Test todo",
-            ],
-        )
-        todo_id = re.findall(r"Added todo #(\d+): Test todo", result.output)
-        assert todo_id is not None
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(storage_file, [{"title": "Test todo"}])
 
         # Delete with confirmation
-        result = runner.invoke(
-            cli,
-            ["--storage-file", str(storage_file), "delete", todo_id[0]],
-            input="y\n",
-        )
+        result = invoke("delete", "1", input="y\n")
 
         assert result.exit_code == 0
-        assert f"Deleted todo #{todo_id[0]}: Test todo" in result.output
+        assert "Deleted todo #1: Test todo" in result.output
 
-        # Verify it's gone from list
-        list_result = runner.invoke(cli, ["--storage-file", str(storage_file), "list"])
-        assert "No todos found" in list_result.output
+        # Verify it's gone from storage
+        assert json.loads(storage_file.read_text()) == []
 
     def test_delete_todo_cancelled(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
     ) -> None:
         """Test cancelling todo deletion."""
-        runner, storage_file = isolated_cli_runner
-
-        # Add a todo first
-        runner.invoke(cli, ["--storage-file", str(storage_file), "add", "Test todo"])
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(storage_file, [{"title": "Test todo"}])
 
         # Delete but cancel
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "delete", "1"], input="n\\n"
-        )
+        result = invoke("delete", "1", input="n\n")
 
         assert result.exit_code == 1  # Click abort returns 1
+        assert "Aborted" in result.output
 
         # Verify todo still exists
-        list_result = runner.invoke(cli, ["--storage-file", str(storage_file), "list"])
-        assert "Test todo" in list_result.output
-
-    def test_delete_nonexistent_todo(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
-    ) -> None:
-        """Test deleting nonexistent todo."""
-        runner, storage_file = isolated_cli_runner
-
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "delete", "999"], input="y\n"
-        )
-
-        assert result.exit_code == 1
-        assert "Todo #999 not found" in result.output
+        data = json.loads(storage_file.read_text())
+        assert [todo["title"] for todo in data] == ["Test todo"]
 
 
 class TestClearCompletedCommand:
     """Test the clear-completed command."""
 
     def test_clear_completed_todos(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
     ) -> None:
         """Test clearing completed todos."""
-        runner, storage_file = isolated_cli_runner
-
-        # Add and complete some todos
-        result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "add",
-                "Todo 1",
-            ],
-        )
-        todo_id = re.findall(r"Added todo #(\d+): Todo 1", result.output)
-        assert todo_id is not None
-        runner.invoke(
-            cli,
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(
+            storage_file,
             [
-                "--storage-file",
-                str(storage_file),
-                "complete",
-                todo_id[0],
+                {"title": "Todo 1", "completed": True},
+                {"title": "Todo 2", "completed": True},
+                {"title": "Todo 3"},
             ],
         )
 
-        result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "add",
-                "Todo 2",
-            ],
-        )
-        todo_id = re.findall(r"Added todo #(\d+): Todo 2", result.output)
-        assert todo_id is not None
-        runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "complete",
-                todo_id[0],
-            ],
-        )
-
-        runner.invoke(cli, ["--storage-file", str(storage_file), "add", "Todo 3"])
-        result = runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "clear-completed",
-            ],
-            input="y\n",
-        )
+        result = invoke("clear-completed", "--yes")
 
         assert result.exit_code == 0
-        assert re.search(
-            r"Cleared \d+ completed todo\(s\)", result.output
-        ), result.output
+        assert "Cleared 2 completed todo(s)" in result.output
 
     def test_clear_completed_none(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
     ) -> None:
         """Test clearing completed when none exist."""
-        runner, storage_file = isolated_cli_runner
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(storage_file, [{"title": "Pending todo"}])
 
-        # Add pending todo
-        runner.invoke(cli, ["--storage-file", str(storage_file), "add", "Pending todo"])
-
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "clear-completed"], input="y\n"
-        )
+        result = invoke("clear-completed", "--yes")
 
         assert result.exit_code == 0
         assert "No completed todos to clear" in result.output
@@ -527,56 +335,139 @@ class TestClearCompletedCommand:
 class TestStatsCommand:
     """Test the stats command."""
 
-    def test_stats_empty(self, isolated_cli_runner: tuple[CliRunner, Path]) -> None:
+    def test_stats_empty(self, isolated_cli_runner: tuple[InvokeCli, Path]) -> None:
         """Test stats with no todos."""
-        runner, storage_file = isolated_cli_runner
+        invoke, _ = isolated_cli_runner
 
-        result = runner.invoke(cli, ["--storage-file", str(storage_file), "stats"])
+        result = invoke("stats")
 
         assert result.exit_code == 0
-        assert "Total todos: 0" in result.output
-        assert "Completed: 0" in result.output
-        assert "Pending: 0" in result.output
-        assert "Completion rate" not in result.output  # No rate when no todos
+        out = result.output
+        assert "Total todos: 0" in out
+        assert "Completed: 0" in out
+        assert "Pending: 0" in out
+        assert "Completion rate" not in out  # No rate when no todos
 
     def test_stats_with_todos(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
     ) -> None:
         """Test stats with mixed todos."""
-        runner, storage_file = isolated_cli_runner
-
-        # Add and complete some todos
-        result = runner.invoke(
-            cli,
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(
+            storage_file,
             [
-                "--storage-file",
-                str(storage_file),
-                "add",
-                "Todo 1",
+                {"title": "Todo 1", "completed": True},
+                {"title": "Todo 2"},
+                {"title": "Todo 3"},
             ],
         )
-        todo_id = re.findall(r"Added todo #(\d+): Todo 1", result.output)
-        assert todo_id is not None
-        runner.invoke(
-            cli,
-            [
-                "--storage-file",
-                str(storage_file),
-                "complete",
-                todo_id[0],
-            ],
+
+        result = invoke("stats")
+
+        assert result.exit_code == 0
+        out = result.output
+        assert "Total todos: 3" in out
+        assert "Completed: 1" in out
+        assert "Pending: 2" in out
+        assert "Completion rate: 33.3%" in out
+
+
+class TestBatchCommand:
+    """Test the batch command."""
+
+    def test_batch_runs_commands(
+        self, isolated_cli_runner: tuple[InvokeCli, Path]
+    ) -> None:
+        """Test running several commands from standard input."""
+        invoke, storage_file = isolated_cli_runner
+
+        commands = [
+            'add "First todo" "Description 1"',
+            "# comments and blank lines are skipped",
+            "",
+            'add "Second todo"',
+            "complete 1",
+            "delete 2 --yes",
+        ]
+        result = invoke("batch", input="\n".join(commands) + "\n")
+
+        assert result.exit_code == 0
+        assert "Added todo #1: First todo" in result.output
+        assert "Added todo #2: Second todo" in result.output
+        assert "Completed todo #1" in result.output
+        assert "Deleted todo #2: Second todo" in result.output
+
+        data = json.loads(storage_file.read_text())
+        assert [(todo["title"], todo["completed"]) for todo in data] == [
+            ("First todo", True)
+        ]
+
+    def test_batch_reports_failures(
+        self, isolated_cli_runner: tuple[InvokeCli, Path]
+    ) -> None:
+        """Test that failed batch commands are reported after saving."""
+        invoke, storage_file = isolated_cli_runner
+
+        result = invoke(
+            "batch", input='add "Kept todo"\ncomplete 999\nunknown\nbatch\n'
         )
 
-        runner.invoke(cli, ["--storage-file", str(storage_file), "add", "Todo 2"])
-        runner.invoke(cli, ["--storage-file", str(storage_file), "add", "Todo 3"])
+        assert result.exit_code == 1
+        assert "Todo #999 not found" in result.output
+        assert "Unknown batch command: unknown" in result.output
+        assert "Unknown batch command: batch" in result.output
+        assert "3 batch command(s) failed" in result.output
+
+        data = json.loads(storage_file.read_text())
+        assert [todo["title"] for todo in data] == ["Kept todo"]
 
-        result = runner.invoke(cli, ["--storage-file", str(storage_file), "stats"])
+    def test_batch_help_line_keeps_changes(
+        self, isolated_cli_runner: tuple[InvokeCli, Path]
+    ) -> None:
+        """Test that a --help line shows help without discarding the batch."""
+        invoke, storage_file = isolated_cli_runner
+
+        result = invoke("batch", input='add "A"\nadd "B" --help\nadd "C"\n')
 
         assert result.exit_code == 0
-        assert "Total todos: 3" in result.output
-        assert "Completed: 1" in result.output
-        assert "Pending: 2" in result.output
-        assert "Completion rate: 33.3%" in result.output
+        assert "Add a new todo item." in result.output
+
+        data = json.loads(storage_file.read_text())
+        assert [todo["title"] for todo in data] == ["A", "C"]
+
+    def test_batch_skips_unparsable_lines(
+        self, isolated_cli_runner: tuple[InvokeCli, Path]
+    ) -> None:
+        """Test that a line with unbalanced quotes does not discard the batch."""
+        invoke, storage_file = isolated_cli_runner
+
+        result = invoke(
+            "batch", input='add "First todo"\nadd "unbalanced\nadd "Last todo"\n'
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid batch line" in result.output
+        assert "1 batch command(s) failed" in result.output
+
+        data = json.loads(storage_file.read_text())
+        assert [todo["title"] for todo in data] == ["First todo", "Last todo"]
+
+    def test_batch_refuses_prompting_commands(
+        self, isolated_cli_runner: tuple[InvokeCli, Path], seed_todos: SeedTodos
+    ) -> None:
+        """Test that confirmation prompts never consume later batch lines."""
+        invoke, storage_file = isolated_cli_runner
+        seed_todos(storage_file, [{"title": "Kept todo", "completed": True}])
+
+        result = invoke("batch", input='delete 1\nclear-completed\nadd "B"\nadd "C"\n')
+
+        assert result.exit_code == 1
+        assert "delete asks for confirmation; pass --yes" in result.output
+        assert "clear-completed asks for confirmation; pass --yes" in result.output
+        assert "2 batch command(s) failed" in result.output
+
+        data = json.loads(storage_file.read_text())
+        assert [todo["title"] for todo in data] == ["Kept todo", "B", "C"]
 
 
 class TestStorageFileOption:
@@ -611,25 +502,39 @@ class TestStorageFileOption:
 class TestErrorHandling:
     """Test error handling in the CLI."""
 
+    @pytest.mark.parametrize("subcommand", ["complete", "uncomplete", "delete"])
+    def test_nonexistent_todo(
+        self, isolated_cli_runner: tuple[InvokeCli, Path], subcommand: str
+    ) -> None:
+        """Test that commands taking a todo ID reject unknown IDs."""
+        invoke, _ = isolated_cli_runner
+
+        args = [subcommand, "999"]
+        if subcommand == "delete":
+            args.append("--yes")
+
+        result = invoke(*args)
+
+        assert result.exit_code == 1
+        assert "Todo #999 not found" in result.output
+
     def test_invalid_todo_id_type(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path]
     ) -> None:
         """Test providing invalid todo ID type."""
-        runner, storage_file = isolated_cli_runner
+        invoke, _ = isolated_cli_runner
 
-        result = runner.invoke(
-            cli, ["--storage-file", str(storage_file), "complete", "not-a-number"]
-        )
+        result = invoke("complete", "not-a-number")
 
         assert result.exit_code != 0
 
     def test_missing_required_argument(
-        self, isolated_cli_runner: tuple[CliRunner, Path]
+        self, isolated_cli_runner: tuple[InvokeCli, Path]
     ) -> None:
         """Test missing required argument."""
-        runner, storage_file = isolated_cli_runner
+        invoke, _ = isolated_cli_runner
 
-        result = runner.invoke(cli, ["--storage-file", str(storage_file), "add"])
+        result = invoke("add")
 
         assert result.exit_code != 0
         assert "Missing argument" in result.output.lower() or "Usage:" in result.output
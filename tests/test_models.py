@@ -11,46 +11,78 @@ This module demonstrates comprehensive testing practices including:
 from __future__ import annotations
 
 import json
-import tempfile
+import pickle
+from dataclasses import fields
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import pytest
 
 from todo_cli.models import TodoItem, TodoManager, TodoStorage
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_mock import MockerFixture
+
+# Stored forms of a pending and a completed todo; from_dict does not modify them
+TODO_DICT: dict[str, Any] = {
+    "id": 42,
+    "title": "Test todo",
+    "description": "Test description",
+    "completed": False,
+    "created_at": "2023-01-01T12:00:00",
+    "completed_at": None,
+}
+COMPLETED_TODO_DICT: dict[str, Any] = {
+    "id": 1,
+    "title": "Test todo",
+    "description": "",
+    "completed": True,
+    "created_at": "2023-01-01T12:00:00",
+    "completed_at": "2023-01-01T13:00:00",
+}
+TODO_DICT_KEYS = frozenset(TODO_DICT)
+# Storage file contents that must fail to load
+INVALID_JSON = b"invalid json content"
+# Valid JSON whose records are missing the required todo fields
+INVALID_TODO_JSON = b'[{"invalid": "data"}]'
+
 
 class TestTodoItem:
     """Test cases for the TodoItem class."""
 
-    def test_create_todo_item(self) -> None:
-        """Test basic todo item creation."""
-        todo = TodoItem("Learn Python", "Study modern practices")
+    @pytest.mark.parametrize(
+        ("title", "description", "expected_description"),
+        [
+            pytest.param(
+                "Learn Python",
+                "Study modern practices",
+                "Study modern practices",
+                id="with-description",
+            ),
+            pytest.param("Buy milk", None, "", id="title-only"),
+        ],
+    )
+    def test_create_todo_item(
+        self, title: str, description: str | None, expected_description: str
+    ) -> None:
+        """Test todo item creation with and without a description."""
+        todo = TodoItem(title) if description is None else TodoItem(title, description)
 
-        assert todo.title == "Learn Python"
-        assert todo.description == "Study modern practices"
+        assert todo.title == title
+        assert todo.description == expected_description
         assert not todo.completed
         assert todo.completed_at is None
         assert isinstance(todo.created_at, datetime)
         assert todo.id > 0
 
-    def test_create_todo_item_minimal(self) -> None:
-        """Test creating todo with minimal required fields."""
-        todo = TodoItem("Buy milk")
-
-        assert todo.title == "Buy milk"
-        assert todo.description == ""
-        assert not todo.completed
-        assert todo.id > 0
-
-    def test_empty_title_raises_error(self) -> None:
-        """Test that empty title raises ValueError."""
-        with pytest.raises(ValueError, match="Todo title cannot be empty"):
-            TodoItem("")
-
+    @pytest.mark.parametrize("title", ["", "   ", "\t\n"])
+    def test_empty_title_raises_error(self, title: str) -> None:
+        """Test that an empty or whitespace-only title raises ValueError."""
         with pytest.raises(ValueError, match="Todo title cannot be empty"):
-            TodoItem("   ")  # Whitespace only
+            TodoItem(title)
 
     def test_auto_increment_ids(self) -> None:
         """Test that IDs are auto-incremented."""
@@ -109,20 +141,18 @@ class TestTodoItem:
         todo = TodoItem("Test todo", "Description")
         todo_dict = todo.to_dict()
 
-        expected_keys = {
-            "id",
-            "title",
-            "description",
-            "completed",
-            "created_at",
-            "completed_at",
-        }
-        assert set(todo_dict.keys()) == expected_keys
+        assert todo_dict.keys() == TODO_DICT_KEYS
         assert todo_dict["title"] == "Test todo"
         assert todo_dict["description"] == "Description"
         assert not todo_dict["completed"]
         assert todo_dict["completed_at"] is None
 
+    def test_field_order_matches_to_dict(self) -> None:
+        """Test that the dataclass fields follow the stored key order."""
+        todo = TodoItem("Test todo")
+
+        assert [f.name for f in fields(todo)] == list(todo.to_dict())
+
     def test_to_dict_completed(self) -> None:
         """Test converting completed todo to dictionary."""
         todo = TodoItem("Test todo")
@@ -134,16 +164,7 @@ class TestTodoItem:
 
     def test_from_dict(self) -> None:
         """Test creating todo from dictionary."""
-        data = {
-            "id": 42,
-            "title": "Test todo",
-            "description": "Test description",
-            "completed": False,
-            "created_at": "2023-01-01T12:00:00",
-            "completed_at": None,
-        }
-
-        todo = TodoItem.from_dict(data)
+        todo = TodoItem.from_dict(TODO_DICT)
 
         assert todo.id == 42
         assert todo.title == "Test todo"
@@ -151,17 +172,15 @@ class TestTodoItem:
         assert not todo.completed
         assert todo.completed_at is None
 
+    @pytest.mark.parametrize("todo_id", [0, -1])
+    def test_from_dict_rejects_invalid_id(self, todo_id: int) -> None:
+        """Test that a stored ID below 1 is rejected instead of renumbered."""
+        with pytest.raises(ValueError, match="Invalid todo ID"):
+            TodoItem.from_dict({**TODO_DICT, "id": todo_id})
+
     def test_from_dict_completed(self) -> None:
         """Test creating completed todo from dictionary."""
-        data = {
-            "id": 1,
-            "title": "Test todo",
-            "completed": True,
-            "created_at": "2023-01-01T12:00:00",
-            "completed_at": "2023-01-01T13:00:00",
-        }
-
-        todo = TodoItem.from_dict(data)
+        todo = TodoItem.from_dict(COMPLETED_TODO_DICT)
 
         assert todo.completed
         assert todo.completed_at is not None
@@ -182,6 +201,11 @@ class TestTodoItem:
         assert restored.created_at == original.created_at
         assert restored.completed_at == original.completed_at
 
+    @pytest.mark.parametrize("data", [TODO_DICT, COMPLETED_TODO_DICT])
+    def test_dict_roundtrip_preserves_stored_form(self, data: dict[str, Any]) -> None:
+        """Test that loading and re-serializing a stored todo is lossless."""
+        assert TodoItem.from_dict(data).to_dict() == data
+
 
 class TestTodoStorage:
     """Test cases for the TodoStorage class."""
@@ -214,6 +238,119 @@ class TestTodoStorage:
         assert loaded_todos[1].title == "Second todo"
         assert not loaded_todos[1].completed
 
+    def test_saved_file_matches_to_dict(self, temp_storage_file: Path) -> None:
+        """Test that the saved file contains the to_dict() representation."""
+        storage = TodoStorage(temp_storage_file)
+
+        todos = [TodoItem("First todo", "Description 1"), TodoItem("Second todo")]
+        todos[0].complete()
+
+        storage.save_todos(todos)
+
+        data = json.loads(temp_storage_file.read_text(encoding="utf-8"))
+        assert data == [todo.to_dict() for todo in todos]
+
+    @pytest.mark.parametrize("file_name", ["todos.json", "todos.jsonl"])
+    def test_saved_file_key_order(self, tmp_path: Path, file_name: str) -> None:
+        """Test that saved records keep their keys in to_dict() order."""
+        storage = TodoStorage(tmp_path / file_name)
+
+        storage.save_todos([TodoItem("Test todo")])
+
+        raw = storage.file_path.read_text(encoding="utf-8")
+        record = json.loads(raw)[0] if file_name == "todos.json" else json.loads(raw)
+        assert list(record) == [
+            "id",
+            "title",
+            "description",
+            "completed",
+            "created_at",
+            "completed_at",
+        ]
+
+    def test_save_and_load_jsonl(self, tmp_path: Path) -> None:
+        """Test saving and loading todos in JSON Lines format."""
+        storage = TodoStorage(tmp_path / "todos.jsonl")
+
+        todos = [TodoItem("First todo", "Description 1"), TodoItem("Second todo")]
+        todos[0].complete()
+
+        storage.save_todos(todos)
+        loaded_todos = storage.load_todos()
+
+        lines = storage.file_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [t.to_dict() for t in todos]
+        assert [todo.to_dict() for todo in loaded_todos] == [
+            todo.to_dict() for todo in todos
+        ]
+
+    def test_append_todos_jsonl(self, tmp_path: Path) -> None:
+        """Test appending todos to a JSON Lines file."""
+        storage = TodoStorage(tmp_path / "todos.jsonl")
+        storage.save_todos([TodoItem("First todo")])
+        # Simulate a hand-edited file without a trailing newline
+        storage.file_path.write_bytes(storage.file_path.read_bytes().rstrip())
+
+        storage.append_todos([TodoItem("Second todo"), TodoItem("Third todo")])
+        loaded_todos = storage.load_todos()
+
+        assert [todo.title for todo in loaded_todos] == [
+            "First todo",
+            "Second todo",
+            "Third todo",
+        ]
+
+    def test_append_todos_requires_jsonl(self, temp_storage_file: Path) -> None:
+        """Test that appending to a JSON array file is rejected."""
+        storage = TodoStorage(temp_storage_file)
+
+        with pytest.raises(ValueError, match="Appending requires"):
+            storage.append_todos([TodoItem("Test todo")])
+
+    def test_save_and_load_binary(self, tmp_path: Path) -> None:
+        """Test saving and loading todos in the binary format."""
+        storage = TodoStorage(tmp_path / "todos.pickle")
+
+        todos = [TodoItem("First todo", "Description 1"), TodoItem("Second todo")]
+        todos[0].complete()
+
+        storage.save_todos(todos)
+        loaded_todos = storage.load_todos()
+
+        assert loaded_todos == todos
+
+    def test_load_invalid_binary_data(self, tmp_path: Path) -> None:
+        """Test loading a binary file without todos raises error."""
+        storage = TodoStorage(tmp_path / "todos.pkl")
+        storage.file_path.write_bytes(pickle.dumps({"invalid": "data"}))
+
+        with pytest.raises(RuntimeError, match="Failed to load todos"):
+            storage.load_todos()
+
+    def test_load_binary_refuses_other_globals(self, tmp_path: Path) -> None:
+        """Test that binary files cannot make the loader import other objects."""
+        storage = TodoStorage(tmp_path / "todos.pickle")
+        storage.file_path.write_bytes(pickle.dumps([print]))
+
+        with pytest.raises(RuntimeError, match=r"Refusing to load builtins\.print"):
+            storage.load_todos()
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            pytest.param(b"cno_such_module\nTodoItem\n)\x81.", id="missing-module"),
+            pytest.param(b"ctodo_cli.models\nRenamedTodo\n)\x81.", id="missing-class"),
+            pytest.param(pickle.dumps([TodoItem("Test todo")])[:-10], id="truncated"),
+        ],
+    )
+    def test_load_corrupt_binary_file(self, tmp_path: Path, raw: bytes) -> None:
+        """Test that unreadable binary files raise the usual load error."""
+        storage = TodoStorage(tmp_path / "todos.pickle")
+        storage.file_path.write_bytes(raw)
+
+        with pytest.raises(RuntimeError, match="Failed to load todos"):
+            storage.load_todos()
+
     def test_load_nonexistent_file(self) -> None:
         """Test loading from nonexistent file returns empty list."""
         storage = TodoStorage("nonexistent.json")
@@ -223,7 +360,7 @@ class TestTodoStorage:
 
     def test_load_invalid_json(self, temp_storage_file: Path) -> None:
         """Test loading invalid JSON raises error."""
-        temp_storage_file.write_text("invalid json content")
+        temp_storage_file.write_bytes(INVALID_JSON)
         storage = TodoStorage(temp_storage_file)
 
         with pytest.raises(RuntimeError, match="Failed to load todos"):
@@ -231,38 +368,55 @@ class TestTodoStorage:
 
     def test_load_invalid_todo_data(self, temp_storage_file: Path) -> None:
         """Test loading invalid todo data raises error."""
-        # Write invalid todo data
-        invalid_data = [{"invalid": "data"}]
-        temp_storage_file.write_text(json.dumps(invalid_data))
+        temp_storage_file.write_bytes(INVALID_TODO_JSON)
 
         storage = TodoStorage(temp_storage_file)
 
         with pytest.raises(RuntimeError, match="Failed to load todos"):
             storage.load_todos()
 
-    @patch("pathlib.Path.open")
-    def test_save_file_error(self, mock_open: Mock, temp_storage_file: Path) -> None:
+    def test_save_file_error(
+        self, monkeypatch: pytest.MonkeyPatch, temp_storage_file: Path
+    ) -> None:
         """Test handling file save errors."""
-        mock_open.side_effect = OSError("Permission denied")
+
+        def fail_open(*_args: Any, **_kwargs: Any) -> NoReturn:
+            raise OSError("Permission denied")
+
+        monkeypatch.setattr(Path, "open", fail_open)
         storage = TodoStorage(temp_storage_file)
 
         with pytest.raises(RuntimeError, match="Failed to save todos"):
             storage.save_todos([])
 
-    def test_create_parent_directories(self) -> None:
+    def test_failed_save_keeps_existing_file(
+        self, mocker: MockerFixture, temp_storage_file: Path
+    ) -> None:
+        """Test that a failed save leaves the previous file untouched."""
+        storage = TodoStorage(temp_storage_file)
+        storage.save_todos([TodoItem("Saved todo")])
+        original_content = temp_storage_file.read_bytes()
+
+        mocker.patch("pathlib.Path.replace", side_effect=OSError("Disk full"))
+        with pytest.raises(RuntimeError, match="Failed to save todos"):
+            storage.save_todos([TodoItem("Unsaved todo")])
+
+        assert temp_storage_file.read_bytes() == original_content
+        assert list(temp_storage_file.parent.glob(f"{temp_storage_file.name}.*")) == []
+
+    def test_create_parent_directories(self, tmp_path: Path) -> None:
         """Test that parent directories are created when saving."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            nested_path = Path(temp_dir) / "nested" / "directory" / "todos.json"
-            storage = TodoStorage(nested_path)
+        nested_path = tmp_path / "nested" / "directory" / "todos.json"
+        storage = TodoStorage(nested_path)
 
-            # Parent directories shouldn't exist initially
-            assert not nested_path.parent.exists()
+        # Parent directories shouldn't exist initially
+        assert not nested_path.parent.exists()
 
-            # Save should create them
-            storage.save_todos([])
+        # Save should create them
+        storage.save_todos([])
 
-            assert nested_path.exists()
-            assert nested_path.parent.exists()
+        assert nested_path.exists()
+        assert nested_path.parent.exists()
 
 
 class TestTodoManager:
@@ -279,6 +433,19 @@ class TestTodoManager:
         manager = TodoManager(todo_storage)
         assert manager.storage is todo_storage
 
+    def test_loads_lazily(
+        self, mocker: MockerFixture, todo_storage: TodoStorage
+    ) -> None:
+        """Test that storage is only read once todos are first needed."""
+        mock_load = mocker.patch.object(TodoStorage, "load_todos", return_value=[])
+        manager = TodoManager(todo_storage)
+        mock_load.assert_not_called()
+
+        manager.get_todos()
+        manager.get_todo_by_id(1)
+
+        mock_load.assert_called_once()
+
     def test_add_todo(self, todo_manager: TodoManager) -> None:
         """Test adding a todo item."""
         todo = todo_manager.add_todo("Test todo", "Description")
@@ -288,8 +455,31 @@ class TestTodoManager:
         assert not todo.completed
 
         # Should be in the manager's list
-        todos = todo_manager.get_todos()
-        assert todo in todos
+        assert todo_manager.get_todo_by_id(todo.id) is todo
+
+    def test_add_todo_after_load_continues_ids(self, todo_storage: TodoStorage) -> None:
+        """Test that new todos get IDs after the highest stored ID."""
+        todo_storage.save_todos(
+            [TodoItem("Stored todo", id=5), TodoItem("Older todo", id=2)]
+        )
+
+        manager = TodoManager(todo_storage)
+        todo = manager.add_todo("New todo")
+
+        assert todo.id == 6
+
+    def test_load_never_lowers_next_id(
+        self, todo_manager: TodoManager, todo_storage: TodoStorage
+    ) -> None:
+        """Test that loading another store keeps IDs unique in the process."""
+        existing = todo_manager.add_todo("Existing todo")
+
+        empty_manager = TodoManager(
+            TodoStorage(todo_storage.file_path.with_name("empty.json"))
+        )
+        todo = empty_manager.add_todo("New todo")
+
+        assert todo.id > existing.id
 
     def test_get_todos_all(self, sample_todos: TodoManager) -> None:
         """Test getting all todos."""
@@ -321,57 +511,113 @@ class TestTodoManager:
         found_todo = sample_todos.get_todo_by_id(999)
         assert found_todo is None
 
-    def test_complete_todo(self, todo_manager: TodoManager) -> None:
-        """Test completing a todo."""
-        todo = todo_manager.add_todo("Test todo")
+    def test_count_todos(self, sample_todos: TodoManager) -> None:
+        """Test that counts track completions, deletions and clears."""
+
+        def counts() -> tuple[int, int, int]:
+            return (
+                sample_todos.count_todos(),
+                sample_todos.count_todos(completed=True),
+                sample_todos.count_todos(completed=False),
+            )
+
+        assert counts() == (3, 1, 2)
+
+        pending_todo = sample_todos.get_todos(completed=False)[0]
+        sample_todos.complete_todo(pending_todo.id)
+        assert counts() == (3, 2, 1)
+
+        sample_todos.delete_todo(pending_todo.id)
+        assert counts() == (2, 1, 1)
 
-        result = todo_manager.complete_todo(todo.id)
+        sample_todos.clear_completed()
+        assert counts() == (1, 0, 1)
+
+    def test_count_todos_after_direct_completion(
+        self, todo_manager: TodoManager, pending_todo: TodoItem
+    ) -> None:
+        """Test that counts follow todos completed outside the manager."""
+        todo_manager.get_todos()[0].complete()
+        assert todo_manager.count_todos(completed=True) == 1
+        assert todo_manager.count_todos(completed=False) == 0
+
+        pending_todo.uncomplete()
+        assert todo_manager.count_todos(completed=True) == 0
+
+    def test_complete_todo(
+        self, todo_manager: TodoManager, pending_todo: TodoItem
+    ) -> None:
+        """Test completing a todo."""
+        result = todo_manager.complete_todo(pending_todo.id)
 
         assert result
-        assert todo.completed
+        assert pending_todo.completed
 
     def test_complete_nonexistent_todo(self, todo_manager: TodoManager) -> None:
         """Test completing nonexistent todo."""
         result = todo_manager.complete_todo(999)
         assert not result
 
-    def test_complete_already_completed_todo(self, todo_manager: TodoManager) -> None:
+    def test_complete_already_completed_todo(
+        self, todo_manager: TodoManager, pending_todo: TodoItem
+    ) -> None:
         """Test completing already completed todo."""
-        todo = todo_manager.add_todo("Test todo")
-        todo.complete()
+        todo_manager.complete_todo(pending_todo.id)
 
-        result = todo_manager.complete_todo(todo.id)
+        result = todo_manager.complete_todo(pending_todo.id)
 
         assert not result  # Should return False as it was already completed
+        assert todo_manager.count_todos(completed=True) == 1
 
-    def test_uncomplete_todo(self, todo_manager: TodoManager) -> None:
+    def test_uncomplete_todo(
+        self, todo_manager: TodoManager, pending_todo: TodoItem
+    ) -> None:
         """Test uncompleting a todo."""
-        todo = todo_manager.add_todo("Test todo")
-        todo.complete()
+        todo_manager.complete_todo(pending_todo.id)
 
-        result = todo_manager.uncomplete_todo(todo.id)
+        result = todo_manager.uncomplete_todo(pending_todo.id)
 
         assert result
-        assert not todo.completed
+        assert not pending_todo.completed
+        assert todo_manager.count_todos(completed=True) == 0
 
-    def test_uncomplete_pending_todo(self, todo_manager: TodoManager) -> None:
+    def test_uncomplete_pending_todo(
+        self, todo_manager: TodoManager, pending_todo: TodoItem
+    ) -> None:
         """Test uncompleting a pending todo."""
-        todo = todo_manager.add_todo("Test todo")
-
-        result = todo_manager.uncomplete_todo(todo.id)
+        result = todo_manager.uncomplete_todo(pending_todo.id)
 
         assert not result  # Should return False as it was already pending
 
-    def test_delete_todo(self, todo_manager: TodoManager) -> None:
+    def test_delete_todo(
+        self, todo_manager: TodoManager, pending_todo: TodoItem
+    ) -> None:
         """Test deleting a todo."""
-        todo = todo_manager.add_todo("Test todo")
-        todo_id = todo.id
+        todo_id = pending_todo.id
 
         result = todo_manager.delete_todo(todo_id)
 
         assert result
         assert todo_manager.get_todo_by_id(todo_id) is None
 
+    def test_delete_todo_keeps_order(self, sample_todos: TodoManager) -> None:
+        """Test that deleting a todo keeps the remaining todos in order."""
+        first, second, third = sample_todos.get_todos()
+
+        sample_todos.delete_todo(second.id)
+
+        assert list(sample_todos.get_todos()) == [first, third]
+
+    def test_delete_todo_unsorted_ids(self, todo_storage: TodoStorage) -> None:
+        """Test deleting from a list whose IDs are not in ascending order."""
+        todo_storage.save_todos(
+            [TodoItem("Third", id=3), TodoItem("First", id=1), TodoItem("Second", id=2)]
+        )
+        manager = TodoManager(todo_storage)
+
+        assert manager.delete_todo(1)
+        assert [todo.id for todo in manager.get_todos()] == [3, 2]
+
     def test_delete_nonexistent_todo(self, todo_manager: TodoManager) -> None:
         """Test deleting nonexistent todo."""
         result = todo_manager.delete_todo(999)
@@ -388,6 +634,7 @@ class TestTodoManager:
         assert count == 1
         completed_after = sample_todos.get_todos(completed=True)
         assert len(completed_after) == 0
+        assert sample_todos.get_todo_by_id(completed_before[0].id) is None
 
     def test_clear_completed_none(self, todo_manager: TodoManager) -> None:
         """Test clearing completed todos when none exist."""
@@ -398,19 +645,118 @@ class TestTodoManager:
         assert count == 0
         assert len(todo_manager.get_todos()) == 1
 
-    @patch.object(TodoStorage, "save_todos")
     def test_save_called_on_modifications(
-        self, mock_save: Mock, todo_manager: TodoManager
+        self, monkeypatch: pytest.MonkeyPatch, todo_manager: TodoManager
     ) -> None:
-        """Test that save is called when todos are modified."""
-        # Reset call count
-        mock_save.reset_mock()
+        """Test that modifications are saved together on flush."""
+        saves: list[list[TodoItem]] = []
+        monkeypatch.setattr(
+            TodoStorage, "save_todos", lambda _self, todos: saves.append(todos)
+        )
 
-        # Operations that should trigger saves
+        # Operations that mark the manager as dirty
         todo = todo_manager.add_todo("Test")
         todo_manager.complete_todo(todo.id)
         todo_manager.uncomplete_todo(todo.id)
         todo_manager.delete_todo(todo.id)
 
-        # Should have been called for each operation
-        assert mock_save.call_count == 4
+        # Nothing is written until the changes are flushed
+        assert saves == []
+
+        todo_manager.flush()
+
+        # All modifications should be written with a single save
+        assert saves == [[]]
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            pytest.param(lambda m, _: m.add_todo("Another todo"), id="add"),
+            pytest.param(lambda m, t: m.complete_todo(t.id), id="complete"),
+            pytest.param(
+                lambda m, t: (m.complete_todo(t.id), m.uncomplete_todo(t.id)),
+                id="uncomplete",
+            ),
+            pytest.param(lambda m, t: m.delete_todo(t.id), id="delete"),
+        ],
+    )
+    def test_flush_saves_after_mutation(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        todo_manager: TodoManager,
+        mutate: Callable[[TodoManager, TodoItem], object],
+    ) -> None:
+        """Test that each kind of modification is saved on flush."""
+        todo = todo_manager.add_todo("Test todo")
+        todo_manager.flush()
+
+        saves: list[list[TodoItem]] = []
+        monkeypatch.setattr(
+            TodoStorage, "save_todos", lambda _self, todos: saves.append(todos)
+        )
+
+        mutate(todo_manager, todo)
+        todo_manager.flush()
+
+        assert len(saves) == 1
+
+    def test_flush_without_changes(
+        self, mocker: MockerFixture, todo_manager: TodoManager
+    ) -> None:
+        """Test that flush does not save when nothing changed."""
+        mock_save = mocker.patch.object(TodoStorage, "save_todos")
+        todo_manager.complete_todo(999)
+        todo_manager.flush()
+
+        mock_save.assert_not_called()
+
+    def test_flush_appends_new_todos_to_jsonl(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test that added todos are appended to JSON Lines storage."""
+        mock_save = mocker.patch.object(TodoStorage, "save_todos")
+        storage = TodoStorage(tmp_path / "todos.jsonl")
+        manager = TodoManager(storage)
+
+        manager.add_todo("First todo")
+        manager.add_todo("Second todo")
+        manager.flush()
+
+        mock_save.assert_not_called()
+        assert [todo.title for todo in storage.load_todos()] == [
+            "First todo",
+            "Second todo",
+        ]
+
+    def test_context_manager_flushes(self, todo_storage: TodoStorage) -> None:
+        """Test that leaving a with block saves pending changes."""
+        with TodoManager(todo_storage) as manager:
+            manager.add_todo("Test todo")
+
+        loaded_todos = todo_storage.load_todos()
+        assert [todo.title for todo in loaded_todos] == ["Test todo"]
+
+    def test_nested_context_manager_flushes_once(
+        self, mocker: MockerFixture, todo_manager: TodoManager
+    ) -> None:
+        """Test that only the outermost with block flushes."""
+        mock_save = mocker.patch.object(TodoStorage, "save_todos")
+        with todo_manager:
+            with todo_manager as manager:
+                manager.add_todo("First todo")
+            with todo_manager as manager:
+                manager.add_todo("Second todo")
+
+            mock_save.assert_not_called()
+
+        mock_save.assert_called_once()
+
+    def test_context_manager_skips_flush_on_error(
+        self, todo_storage: TodoStorage
+    ) -> None:
+        """Test that an error inside a with block discards pending changes."""
+        with pytest.raises(RuntimeError), TodoManager(todo_storage) as manager:
+            manager.add_todo("Test todo")
+            raise RuntimeError("Boom")
+
+        assert todo_storage.load_todos() == []